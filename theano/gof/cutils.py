@@ -19,8 +19,11 @@ def compile_cutils():
     Do just the compilation of cutils_ext.
 
     """
+    # The NpyCapsule_* macros from npy_3kcompat.h wrap PyCObject on
+    # Python 2 and PyCapsule on Python 3, so the same code compiles
+    # under both.
     code = ("""
-        #include <Python.h>
+        #include "numpy/npy_3kcompat.h"
         #include "theano_mod_helper.h"
 
         extern "C"{
@@ -31,14 +34,14 @@ def compile_cutils():
           if(!PyArg_ParseTuple(args,"O",&py_cthunk))
             return NULL;
 
-          if (!PyCObject_Check(py_cthunk)) {
+          if (!NpyCapsule_Check(py_cthunk)) {
             PyErr_SetString(PyExc_ValueError,
-                           "Argument to run_cthunk must be a PyCObject.");
+                           "Argument to run_cthunk must be a NpyCapsule.");
             return NULL;
           }
-          void * ptr_addr = PyCObject_AsVoidPtr(py_cthunk);
+          void * ptr_addr = NpyCapsule_AsVoidPtr(py_cthunk);
           int (*fn)(void*) = (int (*)(void*))(ptr_addr);
-          void* it = PyCObject_GetDesc(py_cthunk);
+          void* it = NpyCapsule_GetDesc(py_cthunk);
           int failure = fn(it);
 
           return Py_BuildValue("i", failure);
@@ -49,10 +52,6 @@ def compile_cutils():
             {NULL, NULL, 0, NULL}        /* Sentinel */
         };""")
     if PY3:
-        # This is not the most efficient code, but it is written this way to
-        # highlight the changes needed to make 2.x code compile under python 3.
-        code = code.replace("<Python.h>", '"numpy/npy_3kcompat.h"', 1)
-        code = code.replace("PyCObject", "NpyCapsule")
         code += """
         static struct PyModuleDef moduledef = {
             PyModuleDef_HEAD_INIT,
@@ -20,6 +20,11 @@ from .fp16_help import write_w
 from .opt import register_opt, register_opt2
 
 
+# Reuse GpuArrayType instances across calls to `GPUA_mrg_uniform.new`,
+# as done for TensorType in theano.sandbox.rng_mrg.
+_output_type_cache = {}
+
+
 class GPUA_mrg_uniform(GpuKernelBase, mrg_uniform_base):
     # GpuArray version
     _f16_ok = True
@@ -49,7 +54,11 @@ class GPUA_mrg_uniform(GpuKernelBase, mrg_uniform_base):
         v_size = as_tensor_variable(size)
         if ndim is None:
             ndim = get_vector_length(v_size)
-        op = cls(GpuArrayType(dtype, (False,) * ndim))
+        otype = _output_type_cache.get((dtype, ndim))
+        if otype is None:
+            otype = GpuArrayType(dtype, (False,) * ndim)
+            _output_type_cache[(dtype, ndim)] = otype
+        op = cls(otype)
         return op(rstate, v_size)
 
     def c_headers(self):
@@ -25,7 +25,8 @@ from theano import gradient, function
 from theano.gradient import undefined_grad
 from theano import tensor
 from theano.tensor import (TensorType, as_tensor_variable, get_vector_length,
-                           cast, opt, scal)
+                           cast, opt, scal, get_scalar_constant_value,
+                           NotScalarConstantError)
 from theano.compile import optdb
 from theano.gof import local_optimizer, ParamsType
 from theano.scalar import bool as bool_t, int32 as int_t
@@ -334,6 +335,13 @@ class mrg_uniform_base(Op):
         return [None for i in eval_points]
 
 
+# TensorType instances are immutable once built, so reuse them across
+# calls to `mrg_uniform.new` instead of building one per random
+# variable: models with many RNG ops repeat the same (dtype, ndim)
+# combination over and over during graph construction.
+_output_type_cache = {}
+
+
 class mrg_uniform(mrg_uniform_base):
     # CPU VERSION
     _f16_ok = True
@@ -358,7 +366,11 @@ class mrg_uniform(mrg_uniform_base):
         v_size = as_tensor_variable(size)
         if ndim is None:
             ndim = get_vector_length(v_size)
-        op = cls(TensorType(dtype, (False,) * ndim))
+        otype = _output_type_cache.get((dtype, ndim))
+        if otype is None:
+            otype = TensorType(dtype, (False,) * ndim)
+            _output_type_cache[(dtype, ndim)] = otype
+        op = cls(otype)
         return op(rstate, v_size)
 
     def perform(self, node, inp, out, params):
@@ -380,7 +392,19 @@ class mrg_uniform(mrg_uniform_base):
 
         n_streams, _ = rstate.shape
 
-        rval = np.zeros(n_elements, dtype=self.output_type.dtype)
+        # Reuse the output buffer from the previous call when it has the
+        # right shape, as the C implementation does with
+        # must_alloc_sample. In loops with a constant shape (e.g. dropout
+        # masks), this keeps the allocation out of the steady state.
+        prev_sample = o_sample[0]
+        if (prev_sample is not None and
+                prev_sample.shape == tuple(size) and
+                prev_sample.dtype == self.output_type.dtype and
+                prev_sample.flags['C_CONTIGUOUS'] and
+                prev_sample.flags['WRITEABLE']):
+            rval = prev_sample.reshape(n_elements)
+        else:
+            rval = np.zeros(n_elements, dtype=self.output_type.dtype)
         if rval.dtype == 'float16':
             mask = 0x7fff
             offset = 1
@@ -634,7 +658,7 @@ def guess_n_streams(size, warn=False):
     # Note that this code was moved out of `MRG_RandomStreams` so that it can
     # be easily accessed from tests, where we want to disable the warning.
     if (isinstance(size, (tuple, list)) and
-            all([isinstance(i, integer_types) for i in size])):
+            all(isinstance(i, integer_types) for i in size)):
         # We can make a guess.
         r = 1
         for s in size:
@@ -839,6 +863,13 @@ class MRG_RandomStreams(object):
             least as precise as floatX.
 
         """
+        # When low and high are their default constants, the post-scaling
+        # `u * (high - low) + low` below is a no-op. Skip building it to
+        # lower optimizer work (manual constant folding, as for `size` in
+        # `normal`).
+        unscaled = (_is_scalar_constant(low, 0) and
+                    _is_scalar_constant(high, 1))
+
         low = as_tensor_variable(low)
         high = as_tensor_variable(high)
 
@@ -853,10 +884,10 @@ class MRG_RandomStreams(object):
 
         if isinstance(size, tuple):
             msg = "size must be a tuple of int or a Theano variable"
-            assert all([isinstance(i, (np.integer, integer_types, Variable))
-                        for i in size]), msg
-            if any([isinstance(i, (np.integer, integer_types)) and i <= 0
-                    for i in size]):
+            assert all(isinstance(i, (np.integer, integer_types, Variable))
+                       for i in size), msg
+            if any(isinstance(i, (np.integer, integer_types)) and i <= 0
+                   for i in size):
                 raise ValueError(
                     "The specified size contains a dimension with value <= 0",
                     size)
@@ -883,6 +914,9 @@ class MRG_RandomStreams(object):
                                size=size, nstreams=orig_nstreams)
         # Add a reference to distinguish from other shared variables
         node_rstate.tag.is_rng = True
+        if unscaled:
+            assert u.dtype == dtype
+            return u
         r = u * (high - low) + low
 
         if u.type.broadcastable != r.type.broadcastable:
@@ -931,7 +965,7 @@ class MRG_RandomStreams(object):
         pvals = as_tensor_variable(pvals)
         pvals = undefined_grad(pvals)
         if size is not None:
-            if any([isinstance(i, integer_types) and i <= 0 for i in size]):
+            if any(isinstance(i, integer_types) and i <= 0 for i in size):
                 raise ValueError(
                     "The specified size contains a dimension with value <= 0",
                     size)
@@ -1067,6 +1101,11 @@ class MRG_RandomStreams(object):
 
         """
         size = _check_size(size)
+        # As in `uniform`, skip the scale and shift when they are the
+        # default constants, so the standard normal case does not pay
+        # for two extra elemwise passes over the samples.
+        avg_is_zero = _is_scalar_constant(avg, 0)
+        std_is_one = _is_scalar_constant(std, 1)
         avg = undefined_grad(as_tensor_variable(avg))
         std = undefined_grad(as_tensor_variable(std))
 
@@ -1124,8 +1163,10 @@ class MRG_RandomStreams(object):
         else:
             samples = norm_samples
         samples = tensor.reshape(samples, newshape=size, ndim=ndim)
-        samples *= std
-        samples += avg
+        if not std_is_one:
+            samples *= std
+        if not avg_is_zero:
+            samples += avg
 
         return samples
 
@@ -1166,6 +1207,23 @@ class MRG_RandomStreams(object):
                            ndim=ndim, dtype=dtype, nstreams=nstreams, **kwargs)
 
 
+def _is_scalar_constant(x, value):
+    """
+    Return True if `x` is known, at graph-construction time, to be the
+    scalar `value`.
+
+    `x` can be a Python or NumPy scalar, or any Theano variable. Only
+    direct constants are recognized; we do not dig through the graph, as
+    a False negative just means the caller builds a scaling graph that
+    the optimizer will remove anyway.
+    """
+    try:
+        return bool(get_scalar_constant_value(
+            as_tensor_variable(x), only_process_constants=True) == value)
+    except NotScalarConstantError:
+        return False
+
+
 def _check_size(size):
     """
     Canonicalise inputs to get valid output sizes for Theano tensors.